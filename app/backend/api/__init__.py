@@ -4,6 +4,9 @@ from .posts import posts_bp
 from .feed import feed_bp
 from .jobs import jobs_bp
 from .messaging import messaging_bp
+from .connections import connections_bp
+from .batch import batch_bp
+from .public import public_bp
 
 __all__ = [
     'auth_bp',
@@ -11,5 +14,8 @@ __all__ = [
     'posts_bp',
     'feed_bp',
     'jobs_bp',
-    'messaging_bp'
+    'messaging_bp',
+    'connections_bp',
+    'batch_bp',
+    'public_bp'
 ] 
\ No newline at end of file
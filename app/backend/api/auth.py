@@ -1,7 +1,7 @@
 from flask import Blueprint, request, jsonify
-from flask_jwt_extended import create_access_token
+from flask_jwt_extended import create_access_token, create_refresh_token, decode_token, get_jwt, get_jwt_identity, jwt_required
 from models.user import User
-from extensions import db, limiter
+from extensions import db, limiter, revocations
 import re
 
 auth_bp = Blueprint('auth', __name__, url_prefix="/api/auth")
@@ -52,5 +52,48 @@ def login():
         return jsonify({'msg': 'Invalid credentials'}), 401
 
     access_token = create_access_token(identity=str(user.id))
-    return jsonify({'token': access_token, 'user': {'id': user.id, 'username': user.username, 'email': user.email}}), 200
+    refresh_token = create_refresh_token(identity=str(user.id))
+    return jsonify({'token': access_token, 'refresh_token': refresh_token, 'user': {'id': user.id, 'username': user.username, 'email': user.email}}), 200
+
+@auth_bp.route('/refresh', methods=['POST'])
+@jwt_required(refresh=True)
+def refresh():
+    access_token = create_access_token(identity=get_jwt_identity())
+    return jsonify({'token': access_token}), 200
+
+@auth_bp.route('/logout', methods=['POST'])
+@jwt_required(verify_type=False)
+def logout():
+    token = get_jwt()
+    revocations.revoke_token(token)
+    # Also drop the refresh token if the client sends it along
+    data = request.get_json(silent=True) or {}
+    if data.get('refresh_token'):
+        try:
+            refresh_payload = decode_token(data['refresh_token'])
+        except Exception:
+            return jsonify({'msg': 'Invalid refresh token'}), 400
+        # Skip it when it is the token in the header (already revoked above)
+        if refresh_payload['sub'] == get_jwt_identity() and refresh_payload['jti'] != token['jti']:
+            revocations.revoke_token(refresh_payload)
+    return jsonify({'msg': 'Logged out'}), 200
+
+@auth_bp.route('/password', methods=['PUT'])
+@jwt_required()
+@limiter.limit("5 per minute")
+def change_password():
+    data = request.get_json() or {}
+    user = User.query.get(get_jwt_identity())
+    if not user or not user.check_password(data.get('current_password', '')):
+        return jsonify({'msg': 'Invalid credentials'}), 401
+    new_password = data.get('new_password', '')
+    if not User.is_password_complex(new_password):
+        return jsonify({'msg': 'Password does not meet complexity requirements'}), 400
+    user.set_password(new_password)
+    db.session.commit()
+    # Every token issued before now (on any device) stops working
+    revocations.revoke_user(user.id)
+    access_token = create_access_token(identity=str(user.id))
+    refresh_token = create_refresh_token(identity=str(user.id))
+    return jsonify({'msg': 'Password changed', 'token': access_token, 'refresh_token': refresh_token}), 200
 
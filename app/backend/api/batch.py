@@ -0,0 +1,102 @@
+from flask import Blueprint, request, jsonify, current_app, copy_current_request_context, g
+from flask_jwt_extended import verify_jwt_in_request
+from extensions import limiter
+from concurrent.futures import ThreadPoolExecutor
+
+batch_bp = Blueprint('batch', __name__)
+
+MAX_SUB_REQUESTS = 20
+executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='batch')
+
+
+def parse_sub_request(item):
+    """Accept {"method": "GET", "path": "/api/posts?page=1"} or "GET /api/posts?page=1"."""
+    if isinstance(item, str):
+        method, _, path = item.strip().partition(' ')
+    elif isinstance(item, dict):
+        method, path = item.get('method', 'GET'), item.get('path', '')
+    else:
+        return None, None
+    if not isinstance(method, str) or not isinstance(path, str):
+        return None, None
+    return method.upper(), path.strip()
+
+def sub_request_environ():
+    """What sub-requests inherit from the batch request: client address and
+    scheme (rate limits, request.is_secure) plus its headers, so Authorization
+    and the read-your-writes cookie/header apply to every sub-request."""
+    environ_base = {key: value for key, value in request.environ.items()
+                    if key.startswith('REMOTE_') or key == 'wsgi.url_scheme'}
+    headers = [(name, value) for name, value in request.headers
+               if name.lower() not in ('content-type', 'content-length')]
+    return environ_base, headers
+
+def run_sub_request(method, path, environ_base, headers, jwt_state=None):
+    # Pushed inside the batch request's app context, so g (including the
+    # already-verified JWT) and the scoped db.session are shared with it.
+    # Worker threads get a fresh app context; jwt_state carries the identity over.
+    app = current_app._get_current_object()
+    if jwt_state:
+        for name, value in jwt_state.items():
+            setattr(g, name, value)
+    with app.test_request_context(path, method=method, headers=headers, environ_base=environ_base):
+        try:
+            rv = app.dispatch_request()
+        except Exception as e:
+            try:
+                rv = app.handle_user_exception(e)
+            except Exception as unhandled:
+                app.log_exception(unhandled)
+                return {'status': 500, 'body': {'msg': 'Internal server error'}}
+        response = app.make_response(rv)
+        body = response.get_json(silent=True) if response.is_json else response.get_data(as_text=True)
+        return {'status': response.status_code, 'body': body}
+
+@batch_bp.route('/api/batch', methods=['POST'])
+@limiter.limit("60 per minute")
+def batch():
+    data = request.get_json(silent=True) or {}
+    items = data.get('requests')
+    if not isinstance(items, list) or not items:
+        return jsonify({'msg': 'requests must be a non-empty list'}), 400
+    if len(items) > MAX_SUB_REQUESTS:
+        return jsonify({'msg': f'At most {MAX_SUB_REQUESTS} requests per batch'}), 400
+
+    # Verify the token once for the whole batch; sub-requests hit the verified-token cache
+    try:
+        verify_jwt_in_request(optional=True)
+    except Exception:
+        pass
+    environ_base, headers = sub_request_environ()
+
+    results = [None] * len(items)
+    jobs = []
+    for i, item in enumerate(items):
+        method, path = parse_sub_request(item)
+        if method is None or not path.startswith('/'):
+            results[i] = {'status': 400, 'body': {'msg': 'Invalid sub-request'}}
+        elif method != 'GET':
+            # Only reads: they are safe to reorder, repeat or run concurrently
+            results[i] = {'status': 405, 'body': {'msg': 'Only GET sub-requests are supported'}}
+        elif path.split('?', 1)[0] == '/api/batch':
+            results[i] = {'status': 400, 'body': {'msg': 'Batches cannot be nested'}}
+        else:
+            jobs.append((i, method, path))
+
+    if data.get('parallel') and len(jobs) > 1:
+        # Each worker thread gets its own request context (and so its own db session)
+        jwt_state = {name: value for name, value in vars(g).items() if name.startswith('_jwt_extended')}
+        futures = [
+            (i, executor.submit(copy_current_request_context(
+                lambda method=method, path=path: run_sub_request(method, path, environ_base, headers, jwt_state))))
+            for i, method, path in jobs
+        ]
+        for i, future in futures:
+            results[i] = future.result()
+    else:
+        for i, method, path in jobs:
+            results[i] = run_sub_request(method, path, environ_base, headers)
+
+    return jsonify({'responses': [
+        dict(result, request=items[i]) for i, result in enumerate(results)
+    ]})
@@ -0,0 +1,229 @@
+from flask import Blueprint, request, jsonify
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from extensions import db
+from models.connection import Connection
+from models.user import User
+from replicas import use_replica
+from metrics import record_cache
+from sqlalchemy import func, select
+from sqlalchemy.orm import aliased
+from array import array
+from collections import OrderedDict
+import threading
+import time
+
+connections_bp = Blueprint('connections', __name__)
+
+SUGGESTION_FANOUT = 200  # most recent neighbors expanded to 2nd degree
+SUGGESTION_MAX = 50  # suggestions computed (and cached) per user
+SUGGESTION_TTL = 300  # seconds
+SUGGESTION_CACHE_SIZE = 10000  # users
+
+
+class AdjacencyCache:
+    """Per-process LRU of accepted-connection lists for hot users.
+
+    Each list is a sorted array('i') of neighbor ids (4 bytes per edge), loaded
+    in one indexed range scan and dropped on any change to that user's edges.
+    """
+
+    def __init__(self, max_users=10000, ttl=60):
+        self.max_users = max_users
+        self.ttl = ttl
+        self._entries = OrderedDict()  # user_id -> (loaded_at, array of neighbor ids)
+        self._lock = threading.Lock()
+
+    def get(self, user_id):
+        return self.get_many([user_id])[user_id]
+
+    def get_many(self, user_ids):
+        now = time.time()
+        found, missing = {}, []
+        with self._lock:
+            for user_id in user_ids:
+                entry = self._entries.get(user_id)
+                if entry and now - entry[0] < self.ttl:
+                    self._entries.move_to_end(user_id)
+                    found[user_id] = entry[1]
+                else:
+                    missing.append(user_id)
+        for user_id in user_ids:
+            record_cache('adjacency', user_id in found)
+        if missing:
+            loaded = {user_id: array('i') for user_id in missing}
+            rows = db.session.query(Connection.user_id, Connection.target_id) \
+                .filter(Connection.user_id.in_(missing), Connection.status == 'accepted') \
+                .order_by(Connection.user_id, Connection.target_id).all()
+            for user_id, target_id in rows:
+                loaded[user_id].append(target_id)
+            found.update(loaded)
+            with self._lock:
+                for user_id, neighbors in loaded.items():
+                    self._entries[user_id] = (now, neighbors)
+                while len(self._entries) > self.max_users:
+                    self._entries.popitem(last=False)
+        return found
+
+    def invalidate(self, *user_ids):
+        with self._lock:
+            for user_id in user_ids:
+                self._entries.pop(user_id, None)
+
+
+adjacency = AdjacencyCache()
+
+
+def user_summaries(user_ids):
+    users = {u.id: u for u in User.query.filter(User.id.in_(user_ids)).all()} if user_ids else {}
+    return [{'id': uid, 'username': users[uid].username} for uid in user_ids if uid in users]
+
+def current_user_id():
+    return int(get_jwt_identity())
+
+
+@connections_bp.route('/api/users/<int:user_id>/connections', methods=['GET'])
+@jwt_required()
+@use_replica
+def list_connections(user_id):
+    page = int(request.args.get('page', 1))
+    per_page = min(int(request.args.get('per_page', 50)), 200)
+    neighbors = adjacency.get(user_id)
+    start = (page - 1) * per_page
+    return jsonify({
+        'connections': user_summaries(list(neighbors[start:start + per_page])),
+        'total': len(neighbors),
+        'page': page,
+        'per_page': per_page,
+    })
+
+@connections_bp.route('/api/connections', methods=['GET'])
+@jwt_required()
+def list_my_connections():
+    return list_connections(current_user_id())
+
+@connections_bp.route('/api/connections/mutual/<int:user_id>', methods=['GET'])
+@jwt_required()
+@use_replica
+def mutual_connections(user_id):
+    lists = adjacency.get_many([current_user_id(), user_id])
+    mine, theirs = lists[current_user_id()], lists[user_id]
+    smaller, larger = sorted((mine, theirs), key=len)
+    mutual = sorted(set(smaller).intersection(larger))
+    return jsonify({'mutual': user_summaries(mutual), 'count': len(mutual)})
+
+# user_id -> (computed_at, [(suggested user_id, mutual count), ...]), LRU order
+suggestion_cache = OrderedDict()
+suggestion_lock = threading.Lock()
+
+def compute_suggestions(me):
+    """Top SUGGESTION_MAX 2nd-degree users by mutual count, best first.
+
+    Expands the user's SUGGESTION_FANOUT most recent connections (so repeat
+    calls see the same sample) and counts in the database, over
+    ix_connections_user_id_status_target_id alone, returning only as many
+    rows as can survive the exclusions.
+    """
+    sample = [row[0] for row in db.session.query(Connection.target_id)
+              .filter_by(user_id=me, status='accepted')
+              .order_by(Connection.created_at.desc(), Connection.target_id)
+              .limit(SUGGESTION_FANOUT).all()]
+    if not sample:
+        return []
+    # Drop people already connected to, pending either way, or me
+    # (two queries so each side uses its own index)
+    sent = db.session.query(Connection.target_id).filter_by(user_id=me, status='pending').all()
+    received = db.session.query(Connection.user_id).filter_by(target_id=me, status='pending').all()
+    excluded = set(adjacency.get(me))
+    excluded.update(row[0] for row in sent + received)
+    excluded.add(me)
+    second = aliased(Connection)
+    mutual = func.count().label('mutual')
+    rows = db.session.execute(
+        select(second.target_id, mutual)
+        .where(second.user_id.in_(sample), second.status == 'accepted')
+        .group_by(second.target_id)
+        .order_by(mutual.desc(), second.target_id)
+        .limit(SUGGESTION_MAX + len(excluded))
+    ).all()
+    return [(uid, count) for uid, count in rows if uid not in excluded][:SUGGESTION_MAX]
+
+def cached_suggestions(me):
+    now = time.time()
+    with suggestion_lock:
+        entry = suggestion_cache.get(me)
+        if entry and now - entry[0] < SUGGESTION_TTL:
+            suggestion_cache.move_to_end(me)
+            record_cache('suggestions', True)
+            return entry[1]
+    record_cache('suggestions', False)
+    suggestions = compute_suggestions(me)
+    with suggestion_lock:
+        suggestion_cache[me] = (now, suggestions)
+        while len(suggestion_cache) > SUGGESTION_CACHE_SIZE:
+            suggestion_cache.popitem(last=False)
+    return suggestions
+
+def invalidate_suggestions(*user_ids):
+    with suggestion_lock:
+        for user_id in user_ids:
+            suggestion_cache.pop(user_id, None)
+
+@connections_bp.route('/api/connections/suggestions', methods=['GET'])
+@jwt_required()
+@use_replica
+def connection_suggestions():
+    limit = min(int(request.args.get('limit', 10)), SUGGESTION_MAX)
+    top = cached_suggestions(current_user_id())[:limit]
+    summaries = {s['id']: s for s in user_summaries([uid for uid, _ in top])}
+    return jsonify({'suggestions': [
+        dict(summaries[uid], mutual_count=count) for uid, count in top if uid in summaries
+    ]})
+
+@connections_bp.route('/api/connections/requests', methods=['GET'])
+@jwt_required()
+def connection_requests():
+    # Served by ix_connections_target_id_user_id
+    rows = Connection.query.filter_by(target_id=current_user_id(), status='pending').all()
+    return jsonify({'requests': user_summaries([row.user_id for row in rows])})
+
+@connections_bp.route('/api/connections/<int:user_id>', methods=['POST'])
+@jwt_required()
+def connect(user_id):
+    me = current_user_id()
+    if user_id == me:
+        return jsonify({'msg': 'Cannot connect to yourself'}), 400
+    if not User.query.get(user_id):
+        return jsonify({'msg': 'User not found'}), 404
+    existing = Connection.query.get((me, user_id))
+    if existing:
+        return jsonify({'msg': 'Already connected' if existing.status == 'accepted' else 'Request already sent',
+                        'status': existing.status}), 200
+    incoming = Connection.query.get((user_id, me))
+    if incoming:
+        # They asked first: accepting creates the reverse edge
+        incoming.status = 'accepted'
+        db.session.add(Connection(user_id=me, target_id=user_id, status='accepted'))
+        status = 'accepted'
+    else:
+        db.session.add(Connection(user_id=me, target_id=user_id, status='pending'))
+        status = 'pending'
+    db.session.commit()
+    adjacency.invalidate(me, user_id)
+    invalidate_suggestions(me, user_id)
+    return jsonify({'msg': 'Connected' if status == 'accepted' else 'Request sent', 'status': status}), 201
+
+@connections_bp.route('/api/connections/<int:user_id>', methods=['DELETE'])
+@jwt_required()
+def disconnect(user_id):
+    """Remove a connection, withdraw a sent request or decline a received one."""
+    me = current_user_id()
+    deleted = Connection.query.filter(
+        ((Connection.user_id == me) & (Connection.target_id == user_id)) |
+        ((Connection.user_id == user_id) & (Connection.target_id == me))
+    ).delete(synchronize_session=False)
+    if not deleted:
+        return jsonify({'msg': 'Not connected'}), 404
+    db.session.commit()
+    adjacency.invalidate(me, user_id)
+    invalidate_suggestions(me, user_id)
+    return jsonify({'msg': 'Connection removed'})
@@ -1,13 +1,58 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint, jsonify, request, current_app
+from flask_jwt_extended import verify_jwt_in_request, get_jwt_identity
 from models.post import Post
 from models.user import User
+from models.profile import Profile, Skill
 from extensions import db
+from replicas import use_replica
+from api.connections import adjacency
+import ranking
 
 feed_bp = Blueprint('feed', __name__)
- 
+
+
+def current_viewer_id():
+    try:
+        verify_jwt_in_request(optional=True)
+    except Exception:
+        return None
+    identity = get_jwt_identity()
+    return int(identity) if identity else None
+
+def ranked_post_ids(query, entity=Post, viewer_id=None):
+    """Rank the newest FEED_CANDIDATES posts matched by `query`, best first.
+
+    Only the columns the scorer needs are fetched; the caller loads full
+    rows for the page it actually returns.
+    """
+    config = current_app.config
+    rows = query.with_entities(entity.id, entity.created_at, entity.likes_count, entity.views_count,
+                               entity.user_id, entity.tags) \
+        .order_by(None).order_by(entity.created_at.desc()).limit(config['FEED_CANDIDATES']).all()
+    if not rows:
+        return []
+    ids, created_at, likes, views, authors, tags = zip(*rows)
+    connections, skills = (), ()
+    if viewer_id is not None:
+        connections = adjacency.get(viewer_id)
+        skills = [name for (name,) in db.session.query(Skill.name).join(Profile)
+                  .filter(Profile.user_id == viewer_id).all()]
+    features = ranking.build_features(
+        ranking.epoch_seconds(created_at), likes, views, authors, tags,
+        half_life_hours=config['FEED_HALF_LIFE_HOURS'], connections=connections, skills=skills,
+    )
+    return ranking.rank(ids, features, config['FEED_RANKER'], config['FEED_RANK_WEIGHTS'])
+
 @feed_bp.route('/feed', methods=['GET'])
+@use_replica
 def get_feed():
-    posts = Post.query.order_by(Post.created_at.desc()).all()
+    # Hot posts only; cold months live in posts_archive (see archive_posts.py)
+    if request.args.get('sort') == 'recent':
+        posts = Post.query.order_by(Post.created_at.desc()).all()
+    else:
+        ids = ranked_post_ids(Post.query, viewer_id=current_viewer_id())
+        by_id = {post.id: post for post in Post.query.filter(Post.id.in_(ids)).all()} if ids else {}
+        posts = [by_id[post_id] for post_id in ids if post_id in by_id]
     result = []
     for post in posts:
         user = User.query.get(post.user_id)
@@ -19,4 +64,4 @@ def get_feed():
             'media_url': post.media_url,
             'created_at': post.created_at.isoformat(),
         })
-    return jsonify(result) 
\ No newline at end of file
+    return jsonify(result)
@@ -3,9 +3,14 @@ from werkzeug.utils import secure_filename
 import os
 from extensions import db
 from models.post import Post
+from models.post_stats import PostStat
+from models.post_archive import post_source
 from models.user import User
-from datetime import datetime
+from replicas import use_replica
+from api.feed import ranked_post_ids, current_viewer_id
+from datetime import datetime, timezone
 from collections import Counter
+from metrics import record_cache, record_upload
 
 posts_bp = Blueprint('posts', __name__)
  
@@ -35,6 +40,7 @@ def create_post():
         filename = secure_filename(f"{datetime.utcnow().strftime('%Y%m%d%H%M%S')}_{file.filename}")
         file_path = os.path.join(UPLOAD_FOLDER, filename)
         file.save(file_path)
+        record_upload('post_media', os.path.getsize(file_path))
         media_url = f"/uploads/{filename}"
     elif file:
         return jsonify({'error': 'Invalid file type'}), 400
@@ -51,7 +57,18 @@ def create_post():
         'created_at': post.created_at.isoformat()
     }), 201 
 
+def parse_date_arg(name):
+    """ISO 8601 query arg as a naive UTC datetime, the way created_at is stored."""
+    value = request.args.get(name)
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
 @posts_bp.route('/api/posts', methods=['GET'])
+@use_replica
 def list_posts():
     # Pagination
     page = int(request.args.get('page', 1))
@@ -61,33 +78,59 @@ def list_posts():
     tags = request.args.get('tags')  # comma-separated
     search = request.args.get('search')
     visibility = request.args.get('visibility')
+    # Date range (ISO 8601); ranges reaching past the archive boundary also read posts_archive
+    try:
+        since = parse_date_arg('since')
+        until = parse_date_arg('until')
+    except ValueError:
+        return jsonify({'error': 'since/until must be ISO 8601 dates'}), 400
+    include_archived = request.args.get('include_archived', '').lower() in ('1', 'true', 'yes')
     # Sorting
     sort = request.args.get('sort', 'created_at')
     order = request.args.get('order', 'desc')
 
-    query = Post.query
+    source = post_source(since, until, include_archived)
+    query = db.session.query(source)
+    if since:
+        query = query.filter(source.created_at >= since)
+    if until:
+        query = query.filter(source.created_at < until)
     if category:
-        query = query.filter(Post.category == category)
+        query = query.filter(source.category == category)
     if tags:
         tag_list = [t.strip() for t in tags.split(',') if t.strip()]
         for tag in tag_list:
-            query = query.filter(Post.tags.like(f'%{tag}%'))
+            query = query.filter(source.tags.like(f'%{tag}%'))
     if search:
-        query = query.filter(Post.content.ilike(f'%{search}%'))
+        query = query.filter(source.content.ilike(f'%{search}%'))
     if visibility:
-        query = query.filter(Post.visibility == visibility)
+        query = query.filter(source.visibility == visibility)
     # Sorting
-    if sort in ['created_at', 'likes_count', 'views_count']:
-        sort_col = getattr(Post, sort)
-        if order == 'asc':
-            query = query.order_by(sort_col.asc())
-        else:
-            query = query.order_by(sort_col.desc())
+    if sort == 'relevance':
+        # Ranks the newest FEED_CANDIDATES matches (see ranking.py) and pages through
+        # them; total counts every match, pages only the ranked window (capped)
+        ids = ranked_post_ids(query, source, current_viewer_id())
+        page_ids = ids[(page - 1) * per_page:page * per_page]
+        by_id = {p.id: p for p in db.session.query(source).filter(source.id.in_(page_ids)).all()} if page_ids else {}
+        posts = [by_id[post_id] for post_id in page_ids if post_id in by_id]
+        total = query.order_by(None).count() if len(ids) >= current_app.config['FEED_CANDIDATES'] else len(ids)
+        capped = total > len(ids)
+        pages = (len(ids) + per_page - 1) // per_page
     else:
-        query = query.order_by(Post.created_at.desc())
-    # Pagination
-    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
-    posts = pagination.items
+        if sort in ['created_at', 'likes_count', 'views_count']:
+            sort_col = getattr(source, sort)
+            if order == 'asc':
+                query = query.order_by(sort_col.asc())
+            else:
+                query = query.order_by(sort_col.desc())
+        else:
+            query = query.order_by(source.created_at.desc())
+        # Pagination
+        pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+        posts = pagination.items
+        total = pagination.total
+        pages = pagination.pages
+        capped = False
     result = []
     for post in posts:
         user = User.query.get(post.user_id)
@@ -106,39 +149,56 @@ def list_posts():
         })
     return jsonify({
         'posts': result,
-        'total': pagination.total,
+        'total': total,
         'page': page,
         'per_page': per_page,
-        'pages': pagination.pages
+        'pages': pages,
+        'capped': capped,
     }) 
 
 # Simple in-memory cache
-category_cache = {'data': None, 'timestamp': 0}
 tag_cache = {'data': None, 'timestamp': 0}
 CACHE_TTL = 60  # seconds
 
 def invalidate_post_cache():
-    category_cache['data'] = None
     tag_cache['data'] = None
 
+# Categories and counts are read from the post_stats aggregate table,
+# which is kept current on every post write, so they need no cache.
 @posts_bp.route('/api/posts/categories', methods=['GET'])
+@use_replica
 def get_categories():
-    import time
-    now = time.time()
-    if category_cache['data'] and now - category_cache['timestamp'] < CACHE_TTL:
-        return jsonify({'categories': category_cache['data']})
-    categories = db.session.query(Post.category).distinct().all()
-    categories = [c[0] for c in categories if c[0]]
-    category_cache['data'] = categories
-    category_cache['timestamp'] = now
-    return jsonify({'categories': categories})
+    stats = PostStat.query.filter(PostStat.scope == 'category', PostStat.post_count > 0) \
+        .order_by(PostStat.scope_key).all()
+    return jsonify({'categories': [s.scope_key for s in stats]})
+
+@posts_bp.route('/api/posts/categories/<category>/stats', methods=['GET'])
+@use_replica
+def get_category_stats(category):
+    stat = PostStat.query.filter_by(scope='category', scope_key=category).first()
+    if not stat or not stat.post_count:
+        return jsonify({'error': 'Category not found'}), 404
+    return jsonify({'category': category, **stat.to_dict()})
+
+@posts_bp.route('/api/posts/users/<int:user_id>/stats', methods=['GET'])
+@use_replica
+def get_user_post_stats(user_id):
+    stat = PostStat.query.filter_by(scope='user', scope_key=str(user_id)).first()
+    if stat:
+        return jsonify({'user_id': user_id, **stat.to_dict()})
+    if not User.query.get(user_id):
+        return jsonify({'error': 'User not found'}), 404
+    return jsonify({'user_id': user_id, 'post_count': 0, 'latest_post_at': None})
 
 @posts_bp.route('/api/posts/popular-tags', methods=['GET'])
+@use_replica
 def get_popular_tags():
     import time
     now = time.time()
     if tag_cache['data'] and now - tag_cache['timestamp'] < CACHE_TTL:
+        record_cache('popular_tags', True)
         return jsonify({'tags': tag_cache['data']})
+    record_cache('popular_tags', False)
     all_tags = db.session.query(Post.tags).all()
     tag_list = []
     for tags in all_tags:
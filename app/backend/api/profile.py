@@ -1,9 +1,10 @@
 from flask import Blueprint, request, jsonify, current_app
-from flask_jwt_extended import jwt_required, get_jwt_identity, verify_jwt_in_request
-from flask_jwt_extended.exceptions import NoAuthorizationError, InvalidHeaderError
+from flask_jwt_extended import jwt_required, get_jwt_identity
 from models.user import User
 from models.profile import Profile, Skill
 from extensions import db
+from replicas import use_replica
+from metrics import record_upload
 import os
 import time
 from werkzeug.utils import secure_filename
@@ -18,16 +19,9 @@ def allowed_file(filename):
 
 profile_bp = Blueprint('profile', __name__)
  
-@profile_bp.before_request
-def log_jwt_errors():
-    try:
-        if request.method != 'OPTIONS':
-            verify_jwt_in_request()
-    except Exception as e:
-        print(f"[JWT ERROR] {str(e)}")
-
 @profile_bp.route('/profile', methods=['GET'])
 @jwt_required()
+@use_replica
 def get_profile():
     user_id = get_jwt_identity()
     user = User.query.get(user_id)
@@ -105,6 +99,7 @@ def upload_profile_image():
     filename = secure_filename(f"avatar_{user_id}_{int(time.time())}.{ext}")
     file_path = os.path.join(UPLOAD_FOLDER, filename)
     file.save(file_path)
+    record_upload('avatar', file_length)
     # Update profile
     profile = Profile.query.filter_by(user_id=user_id).first()
     if not profile:
@@ -0,0 +1,50 @@
+from flask import Blueprint, current_app, jsonify, send_file
+from snapshots import surrogate_keys
+
+public_bp = Blueprint('public', __name__)
+
+# Anonymous, database-free reads of the snapshots written by snapshots.py.
+# The edge keeps the "current" responses until a Surrogate-Key purge; browsers
+# revalidate after a minute. Versioned URLs never change and are cached forever.
+CURRENT_CACHE_CONTROL = 'public, max-age=60'
+EDGE_CACHE_CONTROL = 'max-age=31536000'
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+
+def snapshot_response(kind, object_id, version=None):
+    snapshots = current_app.extensions['snapshots']
+    current = snapshots.current_version(kind, object_id)
+    if current is None or (version is not None and not _is_version(version)):
+        return jsonify({'msg': 'Not found'}), 404
+    try:
+        response = send_file(snapshots.path(kind, object_id, version or current),
+                             mimetype='application/json', etag=version or current)
+    except FileNotFoundError:
+        return jsonify({'msg': 'Not found'}), 404
+    if version is None:
+        response.headers['Cache-Control'] = CURRENT_CACHE_CONTROL
+        response.headers['Surrogate-Control'] = EDGE_CACHE_CONTROL
+        response.headers['Content-Location'] = f'/public/{kind}s/{object_id}/{current}.json'
+    else:
+        response.headers['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+    response.headers['Surrogate-Key'] = surrogate_keys(kind, object_id)
+    return response
+
+def _is_version(version):
+    return len(version) == 16 and all(c in '0123456789abcdef' for c in version)
+
+@public_bp.route('/public/posts/<int:post_id>', methods=['GET'])
+def public_post(post_id):
+    return snapshot_response('post', post_id)
+
+@public_bp.route('/public/posts/<int:post_id>/<version>.json', methods=['GET'])
+def public_post_version(post_id, version):
+    return snapshot_response('post', post_id, version)
+
+@public_bp.route('/public/profiles/<int:user_id>', methods=['GET'])
+def public_profile(user_id):
+    return snapshot_response('profile', user_id)
+
+@public_bp.route('/public/profiles/<int:user_id>/<version>.json', methods=['GET'])
+def public_profile_version(user_id, version):
+    return snapshot_response('profile', user_id, version)
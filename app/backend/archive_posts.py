@@ -0,0 +1,96 @@
+"""Move cold posts (whole months older than POSTS_HOT_MONTHS) into posts_archive.
+
+Their media files move to ARCHIVE_MEDIA_FOLDER and media_url is rewritten to
+/uploads/archive/<file>. Run from app/backend, e.g. from a monthly cron job:
+
+    python archive_posts.py [--months 6] [--batch-size 500] [--dry-run]
+
+post_stats is deliberately left alone: archived posts still count.
+"""
+import argparse
+import os
+import shutil
+from datetime import date
+
+from sqlalchemy import func, select
+
+from main import app
+from extensions import db, snapshots
+from models.post import Post
+from models.post_archive import ArchivedPost
+from api.posts import UPLOAD_FOLDER
+
+
+def month_cutoff(months, today=None):
+    """First day of the month `months` months before the current one."""
+    today = today or date.today()
+    index = today.year * 12 + today.month - 1 - months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def archive_media(media_url, archive_folder):
+    """Copy an upload into the archive folder and return (new_url, source_path)."""
+    if not media_url or not media_url.startswith('/uploads/') or media_url.startswith('/uploads/archive/'):
+        return media_url, None
+    filename = media_url[len('/uploads/'):]
+    source = os.path.join(UPLOAD_FOLDER, filename)
+    if not os.path.exists(source):
+        return media_url, None
+    shutil.copy2(source, os.path.join(archive_folder, filename))
+    return f'/uploads/archive/{filename}', source
+
+
+def archive_cold_posts(months, batch_size, dry_run=False):
+    posts = Post.__table__
+    archive = ArchivedPost.__table__
+    archive_folder = app.config['ARCHIVE_MEDIA_FOLDER']
+    os.makedirs(archive_folder, exist_ok=True)
+    cutoff = month_cutoff(months)
+    # The newest post always stays hot: MySQL before 8.0 recomputes AUTO_INCREMENT
+    # as MAX(id)+1 of `posts` on restart and would otherwise hand out archived ids again
+    newest_id = db.session.execute(select(func.max(posts.c.id))).scalar()
+    if newest_id is None:
+        return cutoff, 0
+    cold = (posts.c.created_at < cutoff) & (posts.c.id < newest_id)
+    if dry_run:
+        count = db.session.execute(select(func.count()).where(cold)).scalar()
+        return cutoff, count
+    moved = 0
+    while True:
+        # Oldest first, served by ix_posts_created_at
+        rows = db.session.execute(
+            select(posts).where(cold).order_by(posts.c.created_at).limit(batch_size)
+        ).mappings().all()
+        if not rows:
+            break
+        archived, copied = [], []
+        row_media = {row['id']: row['media_url'] for row in rows}
+        for row in rows:
+            media_url, source = archive_media(row['media_url'], archive_folder)
+            archived.append(dict(row, media_url=media_url))
+            if source:
+                copied.append(source)
+        # Core statements on purpose: the Post mapper events would decrement post_stats
+        db.session.execute(archive.insert(), archived)
+        db.session.execute(posts.delete().where(posts.c.id.in_([row['id'] for row in rows])))
+        db.session.commit()
+        # Public snapshots embed media_url, so re-render the ones whose media moved
+        snapshots.publish([('post', row['id']) for row in archived
+                           if row['visibility'] == 'public' and row['media_url'] != row_media[row['id']]])
+        # Only drop the originals once the rows pointing at the archive copies are committed
+        for source in copied:
+            os.remove(source)
+        moved += len(rows)
+        print(f'Archived {moved} posts...')
+    return cutoff, moved
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--months', type=int, default=app.config['POSTS_HOT_MONTHS'])
+    parser.add_argument('--batch-size', type=int, default=500)
+    parser.add_argument('--dry-run', action='store_true')
+    args = parser.parse_args()
+    with app.app_context():
+        cutoff, moved = archive_cold_posts(args.months, args.batch_size, args.dry_run)
+    print(f"{'Would archive' if args.dry_run else 'Archived'} {moved} posts created before {cutoff.isoformat()}.")
@@ -0,0 +1,80 @@
+"""Benchmark feed ranking cost per 1,000 candidates.
+
+Compares the vectorized ranking pass with the equivalent per-post Python
+loop on synthetic candidates. Needs no database:
+
+    python bench_ranking.py [--candidates 1000] [--repeat 200]
+"""
+import argparse
+import math
+import random
+import time
+from datetime import datetime, timedelta
+
+import ranking
+
+TAGS = ['python', 'sql', 'react', 'design', 'hiring', 'career', 'ml', 'devops', 'flask', 'remote']
+
+
+def make_candidates(n, now):
+    return {
+        'ids': list(range(n)),
+        'created_at': [now - timedelta(minutes=random.randint(0, 7 * 24 * 60)) for _ in range(n)],
+        'likes': [random.randint(0, 500) for _ in range(n)],
+        'views': [random.randint(0, 5000) for _ in range(n)],
+        'author_ids': [random.randint(1, 5000) for _ in range(n)],
+        'tags': [','.join(random.sample(TAGS, random.randint(0, 4))) for _ in range(n)],
+    }
+
+
+def rank_vectorized(c, now, connections, skills):
+    features = ranking.build_features(ranking.epoch_seconds(c['created_at']), c['likes'], c['views'],
+                                      c['author_ids'], c['tags'], now=now, connections=connections, skills=skills)
+    return ranking.rank(c['ids'], features)
+
+
+def rank_per_post(c, now, connections, skills):
+    connected = set(connections)
+    skill_set = {s.lower() for s in skills}
+    max_likes = max((math.log1p(v) for v in c['likes']), default=0) or 1
+    max_views = max((math.log1p(v) for v in c['views']), default=0) or 1
+    w = ranking.DEFAULT_WEIGHTS
+    scored = []
+    for i in range(len(c['ids'])):
+        age_hours = (now - c['created_at'][i]).total_seconds() / 3600
+        tags = [t for t in c['tags'][i].lower().split(',') if t]
+        overlap = sum(t in skill_set for t in tags) / len(tags) if tags else 0
+        score = (w['recency'] * 2 ** (-age_hours / 24)
+                 + w['likes'] * math.log1p(c['likes'][i]) / max_likes
+                 + w['views'] * math.log1p(c['views'][i]) / max_views
+                 + w['affinity'] * (c['author_ids'][i] in connected)
+                 + w['tag_overlap'] * overlap)
+        scored.append((score, c['ids'][i]))
+    scored.sort(key=lambda s: -s[0])
+    return [post_id for _, post_id in scored]
+
+
+def bench(fn, repeat, *args):
+    fn(*args)  # warm up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(*args)
+    return (time.perf_counter() - start) / repeat
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--candidates', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+
+    random.seed(0)
+    now = datetime.utcnow()
+    candidates = make_candidates(args.candidates, now)
+    connections = random.sample(range(1, 5001), 300)
+    skills = ['Python', 'SQL', 'Flask']
+
+    scale = 1000 / args.candidates
+    for name, fn in [('vectorized', rank_vectorized), ('per-post', rank_per_post)]:
+        seconds = bench(fn, args.repeat, candidates, now, connections, skills)
+        print(f'{name:>10}: {seconds * 1000 * scale:.3f} ms per 1,000 candidates')
@@ -1,7 +1,15 @@
 from flask_sqlalchemy import SQLAlchemy
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
+from replicas import ReplicaRouter, RoutingSession
+from tokens import CachedJWTManager, RevocationList
+from metrics import Metrics
+from snapshots import Snapshots
 
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={'class_': RoutingSession})
+replicas = ReplicaRouter()
 limiter = Limiter(key_func=get_remote_address)
-
+jwt = CachedJWTManager()
+revocations = RevocationList()
+metrics = Metrics()
+snapshots = Snapshots()
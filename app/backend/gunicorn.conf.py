@@ -0,0 +1,9 @@
+# Loaded automatically by gunicorn when started from app/backend.
+import os
+
+
+def child_exit(server, worker):
+    # Drop a dead worker's live gauges from the shared multiprocess metrics dir
+    if 'PROMETHEUS_MULTIPROC_DIR' in os.environ:
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(worker.pid)
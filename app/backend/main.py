@@ -1,9 +1,10 @@
 from flask import Flask, send_from_directory
 from config import Config
-from extensions import db, limiter
+from extensions import db, limiter, replicas, jwt, revocations, metrics, snapshots
+from replicas import RoutingSession
 from flask_migrate import Migrate
 from flask_cors import CORS
-from flask_jwt_extended import JWTManager
+from tokens import log_jwt_errors
 import os
 
 ALLOWED_ORIGINS = os.getenv('ALLOWED_ORIGINS', 'http://localhost:5173,http://127.0.0.1:5173,https://your-frontend-url.onrender.com').split(',')
@@ -16,22 +17,34 @@ def create_app():
     CORS(app,
          origins=ALLOWED_ORIGINS,
          methods=['GET', 'POST', 'PUT', 'DELETE', 'OPTIONS'],
-         allow_headers=['Content-Type', 'Authorization', 'X-Requested-With'],
+         allow_headers=['Content-Type', 'Authorization', 'X-Requested-With', 'X-Last-Write'],
+         expose_headers=['X-Last-Write'],
          supports_credentials=True,
          max_age=3600)
+    metrics.init_app(app)
     db.init_app(app)
+    replicas.init_app(app)
+    snapshots.init_app(app, RoutingSession)
     limiter.init_app(app)
     Migrate(app, db)
-    JWTManager(app)
+    jwt.init_app(app)
+    revocations.init_app(app, jwt)
+    log_jwt_errors(jwt)
 
     from api.auth import auth_bp
     from api.posts import posts_bp
     from api.feed import feed_bp
     from api.profile import profile_bp
+    from api.connections import connections_bp
+    from api.batch import batch_bp
+    from api.public import public_bp
     app.register_blueprint(auth_bp)
     app.register_blueprint(posts_bp)
     app.register_blueprint(feed_bp)
     app.register_blueprint(profile_bp)
+    app.register_blueprint(connections_bp)
+    app.register_blueprint(batch_bp)
+    app.register_blueprint(public_bp)
 
     # Serve uploaded media files
     @app.route('/uploads/<path:filename>')
@@ -39,6 +52,10 @@ def create_app():
         uploads_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'uploads')
         return send_from_directory(uploads_dir, filename)
 
+    @app.route('/uploads/archive/<path:filename>')
+    def archived_media(filename):
+        return send_from_directory(app.config['ARCHIVE_MEDIA_FOLDER'], filename)
+
     @app.route('/uploads/avatars/<path:filename>')
     def uploaded_avatar(filename):
         uploads_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'uploads/avatars')
@@ -0,0 +1,77 @@
+"""Prometheus metrics, exposed at /metrics.
+
+Under gunicorn set PROMETHEUS_MULTIPROC_DIR to an empty directory shared by
+the workers: each worker then writes its samples to its own mmap'd file and
+/metrics aggregates all of them (see gunicorn.conf.py for the cleanup hook).
+"""
+import os
+import time
+
+from flask import Response, g, has_request_context, request
+from prometheus_client import (CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Histogram,
+                               generate_latest, multiprocess, REGISTRY)
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+REQUEST_LATENCY = Histogram(
+    'http_request_duration_seconds', 'Request latency by endpoint',
+    ['blueprint', 'endpoint', 'method'],
+)
+REQUESTS = Counter(
+    'http_requests_total', 'Requests by endpoint and status code',
+    ['blueprint', 'endpoint', 'method', 'status'],
+)
+DB_QUERIES = Counter('db_queries_total', 'SQL statements executed, by endpoint', ['endpoint'])
+CACHE_REQUESTS = Counter('cache_requests_total', 'Cache lookups by cache and result', ['cache', 'result'])
+UPLOAD_BYTES = Counter('upload_bytes_total', 'Bytes of uploaded media stored', ['kind'])
+RATE_LIMITED = Counter('rate_limit_rejections_total', 'Requests rejected by flask-limiter', ['endpoint'])
+
+
+def record_cache(cache, hit):
+    CACHE_REQUESTS.labels(cache=cache, result='hit' if hit else 'miss').inc()
+
+
+def record_upload(kind, num_bytes):
+    UPLOAD_BYTES.labels(kind=kind).inc(num_bytes)
+
+
+def _endpoint():
+    # Unmatched URLs share one label value so scanners can't blow up cardinality
+    return request.endpoint or 'unmatched'
+
+
+class Metrics:
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.before_request(self._start_timer)
+        app.after_request(self._observe)
+        app.add_url_rule('/metrics', 'metrics', self.export)
+        event.listen(Engine, 'before_cursor_execute', self._count_query)
+
+    def _start_timer(self):
+        g.metrics_start = time.perf_counter()
+
+    def _observe(self, response):
+        start = g.pop('metrics_start', None)
+        endpoint = _endpoint()
+        blueprint = request.blueprint or 'app'
+        if start is not None:
+            REQUEST_LATENCY.labels(blueprint, endpoint, request.method).observe(time.perf_counter() - start)
+        REQUESTS.labels(blueprint, endpoint, request.method, response.status_code).inc()
+        if response.status_code == 429:
+            RATE_LIMITED.labels(endpoint).inc()
+        return response
+
+    def _count_query(self, conn, cursor, statement, parameters, context, executemany):
+        DB_QUERIES.labels(_endpoint() if has_request_context() else 'background').inc()
+
+    def export(self):
+        if 'PROMETHEUS_MULTIPROC_DIR' in os.environ:
+            registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry)
+        else:
+            registry = REGISTRY
+        return Response(generate_latest(registry), content_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,53 @@
+"""Add composite post indexes
+
+Revision ID: 5b8d0e3f7a21
+Revises: 24ea7796a530
+Create Date: 2026-10-19 10:12:31.204118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5b8d0e3f7a21'
+down_revision = '24ea7796a530'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('posts', schema=None) as batch_op:
+        # Superseded by ix_posts_category_created_at (same prefix)
+        batch_op.drop_index(batch_op.f('ix_posts_category'))
+        batch_op.create_index('ix_posts_user_id_created_at', ['user_id', 'created_at'], unique=False)
+        batch_op.create_index('ix_posts_visibility_created_at', ['visibility', 'created_at'], unique=False)
+        batch_op.create_index('ix_posts_visibility_likes_count', ['visibility', 'likes_count'], unique=False)
+        batch_op.create_index('ix_posts_visibility_views_count', ['visibility', 'views_count'], unique=False)
+        batch_op.create_index('ix_posts_category_created_at', ['category', 'created_at'], unique=False)
+        batch_op.create_index('ix_posts_visibility_category_created_at', ['visibility', 'category', 'created_at'], unique=False)
+        batch_op.create_index('ix_posts_category_likes_count', ['category', 'likes_count'], unique=False)
+        batch_op.create_index('ix_posts_category_views_count', ['category', 'views_count'], unique=False)
+        batch_op.create_index('ix_posts_likes_count', ['likes_count'], unique=False)
+        batch_op.create_index('ix_posts_views_count', ['views_count'], unique=False)
+
+    with op.batch_alter_table('skills', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_skills_profile_id'), ['profile_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('skills', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_skills_profile_id'))
+
+    with op.batch_alter_table('posts', schema=None) as batch_op:
+        batch_op.drop_index('ix_posts_views_count')
+        batch_op.drop_index('ix_posts_likes_count')
+        batch_op.drop_index('ix_posts_category_views_count')
+        batch_op.drop_index('ix_posts_category_likes_count')
+        batch_op.drop_index('ix_posts_visibility_category_created_at')
+        batch_op.drop_index('ix_posts_category_created_at')
+        batch_op.drop_index('ix_posts_visibility_views_count')
+        batch_op.drop_index('ix_posts_visibility_likes_count')
+        batch_op.drop_index('ix_posts_visibility_created_at')
+        batch_op.drop_index('ix_posts_user_id_created_at')
+        batch_op.create_index(batch_op.f('ix_posts_category'), ['category'], unique=False)
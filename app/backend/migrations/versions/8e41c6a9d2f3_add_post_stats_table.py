@@ -0,0 +1,52 @@
+"""Add post_stats table
+
+Revision ID: 8e41c6a9d2f3
+Revises: 5b8d0e3f7a21
+Create Date: 2026-10-19 11:02:47.551930
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8e41c6a9d2f3'
+down_revision = '5b8d0e3f7a21'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    post_stats = op.create_table('post_stats',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('scope', sa.String(length=16), nullable=False),
+    sa.Column('scope_key', sa.String(length=64), nullable=False),
+    sa.Column('post_count', sa.Integer(), nullable=False),
+    sa.Column('latest_post_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('scope', 'scope_key', name='uq_post_stats_scope_key')
+    )
+
+    # Backfill from existing posts
+    posts = sa.table('posts',
+        sa.column('user_id', sa.Integer()),
+        sa.column('category', sa.String(length=64)),
+        sa.column('created_at', sa.DateTime()),
+    )
+    columns = ['scope', 'scope_key', 'post_count', 'latest_post_at']
+    op.execute(post_stats.insert().from_select(columns,
+        sa.select(
+            sa.literal('category'), posts.c.category,
+            sa.func.count(), sa.func.max(posts.c.created_at),
+        ).where(posts.c.category.isnot(None)).group_by(posts.c.category)
+    ))
+    op.execute(post_stats.insert().from_select(columns,
+        sa.select(
+            sa.literal('user'), sa.cast(posts.c.user_id, sa.String(length=64)),
+            sa.func.count(), sa.func.max(posts.c.created_at),
+        ).group_by(posts.c.user_id)
+    ))
+
+
+def downgrade():
+    op.drop_table('post_stats')
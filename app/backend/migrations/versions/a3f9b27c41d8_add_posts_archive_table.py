@@ -0,0 +1,48 @@
+"""Add posts_archive table
+
+Revision ID: a3f9b27c41d8
+Revises: 8e41c6a9d2f3
+Create Date: 2026-10-19 12:20:05.318842
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3f9b27c41d8'
+down_revision = '8e41c6a9d2f3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('posts_archive',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('content', sa.Text(), nullable=False),
+    sa.Column('media_url', sa.String(length=255), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('category', sa.String(length=64), nullable=True),
+    sa.Column('tags', sa.String(length=255), nullable=True),
+    sa.Column('visibility', sa.String(length=32), nullable=True),
+    sa.Column('likes_count', sa.Integer(), nullable=True),
+    sa.Column('views_count', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('posts_archive', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_posts_archive_created_at'), ['created_at'], unique=False)
+        batch_op.create_index('ix_posts_archive_user_id_created_at', ['user_id', 'created_at'], unique=False)
+        batch_op.create_index('ix_posts_archive_visibility_created_at', ['visibility', 'created_at'], unique=False)
+        batch_op.create_index('ix_posts_archive_category_created_at', ['category', 'created_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('posts_archive', schema=None) as batch_op:
+        batch_op.drop_index('ix_posts_archive_category_created_at')
+        batch_op.drop_index('ix_posts_archive_visibility_created_at')
+        batch_op.drop_index('ix_posts_archive_user_id_created_at')
+        batch_op.drop_index(batch_op.f('ix_posts_archive_created_at'))
+
+    op.drop_table('posts_archive')
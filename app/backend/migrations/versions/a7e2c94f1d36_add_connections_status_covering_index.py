@@ -0,0 +1,26 @@
+"""Add covering index for accepted connections
+
+Revision ID: a7e2c94f1d36
+Revises: f3a8d61c0e57
+Create Date: 2026-10-20 15:41:08.226713
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7e2c94f1d36'
+down_revision = 'f3a8d61c0e57'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('connections', schema=None) as batch_op:
+        batch_op.create_index('ix_connections_user_id_status_target_id', ['user_id', 'status', 'target_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('connections', schema=None) as batch_op:
+        batch_op.drop_index('ix_connections_user_id_status_target_id')
@@ -0,0 +1,37 @@
+"""Add connections table
+
+Revision ID: d2b4a8e6f019
+Revises: c71e5d08b6a4
+Create Date: 2026-10-19 14:55:10.640295
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd2b4a8e6f019'
+down_revision = 'c71e5d08b6a4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('connections',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('target_id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(length=16), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['target_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('user_id', 'target_id')
+    )
+    with op.batch_alter_table('connections', schema=None) as batch_op:
+        batch_op.create_index('ix_connections_target_id_user_id', ['target_id', 'user_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('connections', schema=None) as batch_op:
+        batch_op.drop_index('ix_connections_target_id_user_id')
+
+    op.drop_table('connections')
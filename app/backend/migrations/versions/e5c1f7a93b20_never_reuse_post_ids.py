@@ -0,0 +1,45 @@
+"""Never reuse post ids after archival
+
+Revision ID: e5c1f7a93b20
+Revises: d2b4a8e6f019
+Create Date: 2026-10-20 10:12:44.907316
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5c1f7a93b20'
+down_revision = 'd2b4a8e6f019'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_bind()
+    dialect = bind.dialect.name
+    # Start the id counter past every id ever issued, archived ones included
+    next_id = bind.execute(sa.text(
+        'SELECT MAX(id) FROM (SELECT id FROM posts UNION ALL SELECT id FROM posts_archive) ids'
+    )).scalar() or 0
+    if dialect == 'sqlite':
+        # Plain INTEGER PRIMARY KEY hands out max(rowid)+1; AUTOINCREMENT keeps a high-water mark
+        with op.batch_alter_table('posts', schema=None, recreate='always',
+                                  table_kwargs={'sqlite_autoincrement': True}) as batch_op:
+            pass
+        op.execute(sa.text("DELETE FROM sqlite_sequence WHERE name = 'posts'"))
+        op.execute(sa.text("INSERT INTO sqlite_sequence (name, seq) VALUES ('posts', :seq)").bindparams(seq=next_id))
+    elif dialect == 'mysql':
+        op.execute(f'ALTER TABLE posts AUTO_INCREMENT = {next_id + 1}')
+    elif dialect == 'postgresql':
+        op.execute(sa.text(
+            "SELECT setval(pg_get_serial_sequence('posts', 'id'), GREATEST(:seq, 1), :seq > 0)"
+        ).bindparams(seq=next_id))
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'sqlite':
+        with op.batch_alter_table('posts', schema=None, recreate='always',
+                                  table_kwargs={'sqlite_autoincrement': False}) as batch_op:
+            pass
@@ -0,0 +1,26 @@
+"""Index token_revocations.revoked_at
+
+Revision ID: f3a8d61c0e57
+Revises: e5c1f7a93b20
+Create Date: 2026-10-20 11:03:27.584190
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3a8d61c0e57'
+down_revision = 'e5c1f7a93b20'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('token_revocations', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_token_revocations_revoked_at'), ['revoked_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('token_revocations', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_token_revocations_revoked_at'))
@@ -0,0 +1,20 @@
+from extensions import db
+
+
+class Connection(db.Model):
+    """Directed edge between two users.
+
+    An accepted connection is stored as two rows (A->B and B->A) so a user's
+    neighbors are one primary-key range scan; a pending request is a single
+    requester->target row until it is accepted.
+    """
+    __tablename__ = 'connections'
+    __table_args__ = (
+        db.Index('ix_connections_target_id_user_id', 'target_id', 'user_id'),
+        # Covers accepted-neighbor reads (adjacency loads, 2nd-degree counts) without row lookups
+        db.Index('ix_connections_user_id_status_target_id', 'user_id', 'status', 'target_id'),
+    )
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
+    target_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
+    status = db.Column(db.String(16), nullable=False, default='pending')  # 'pending' or 'accepted'
+    created_at = db.Column(db.DateTime, default=db.func.now())
@@ -3,12 +3,28 @@ from datetime import datetime
 
 class Post(db.Model):
     __tablename__ = 'posts'
+    # Composite indexes matched to the list_posts/feed query shapes:
+    # equality filter on visibility/category followed by the sort column.
+    __table_args__ = (
+        db.Index('ix_posts_user_id_created_at', 'user_id', 'created_at'),
+        db.Index('ix_posts_visibility_created_at', 'visibility', 'created_at'),
+        db.Index('ix_posts_visibility_likes_count', 'visibility', 'likes_count'),
+        db.Index('ix_posts_visibility_views_count', 'visibility', 'views_count'),
+        db.Index('ix_posts_category_created_at', 'category', 'created_at'),
+        db.Index('ix_posts_visibility_category_created_at', 'visibility', 'category', 'created_at'),
+        db.Index('ix_posts_category_likes_count', 'category', 'likes_count'),
+        db.Index('ix_posts_category_views_count', 'category', 'views_count'),
+        db.Index('ix_posts_likes_count', 'likes_count'),
+        db.Index('ix_posts_views_count', 'views_count'),
+        # Ids are never reused, even once the rows holding them move to posts_archive
+        {'sqlite_autoincrement': True},
+    )
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
     content = db.Column(db.Text, nullable=False)
     media_url = db.Column(db.String(255), nullable=True)
     created_at = db.Column(db.DateTime, index=True, default=db.func.now())
-    category = db.Column(db.String(64), index=True)
+    category = db.Column(db.String(64))
     tags = db.Column(db.String(255), index=True)
     visibility = db.Column(db.String(32), default='public')
     likes_count = db.Column(db.Integer, default=0)
@@ -0,0 +1,72 @@
+from extensions import db
+from models.post import Post
+from sqlalchemy import func, select, union_all
+from sqlalchemy.orm import aliased
+
+
+class ArchivedPost(db.Model):
+    """Cold posts moved out of ``posts`` by archive_posts.py.
+
+    Same columns as Post (and the same ids), so either table - or a union of
+    both - can be read through the Post serialization code unchanged.
+    """
+    __tablename__ = 'posts_archive'
+    __table_args__ = (
+        db.Index('ix_posts_archive_user_id_created_at', 'user_id', 'created_at'),
+        db.Index('ix_posts_archive_visibility_created_at', 'visibility', 'created_at'),
+        db.Index('ix_posts_archive_category_created_at', 'category', 'created_at'),
+    )
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    content = db.Column(db.Text, nullable=False)
+    media_url = db.Column(db.String(255), nullable=True)
+    created_at = db.Column(db.DateTime, index=True)
+    category = db.Column(db.String(64))
+    tags = db.Column(db.String(255))
+    visibility = db.Column(db.String(32), default='public')
+    likes_count = db.Column(db.Integer, default=0)
+    views_count = db.Column(db.Integer, default=0)
+
+    user = db.relationship('User')
+
+
+def archive_boundary():
+    """Newest archived created_at; every post in `posts` is newer than this.
+
+    Read live rather than cached: archive_posts.py runs in another process, and
+    a stale boundary would silently drop just-archived posts from ranged
+    queries. MAX over ix_posts_archive_created_at is a single index lookup.
+    """
+    return db.session.query(func.max(ArchivedPost.created_at)).scalar()
+
+
+def post_source(since=None, until=None, include_archived=False):
+    """Return the entity to query for posts created in [since, until).
+
+    Only the hot ``posts`` table is touched unless the range reaches back past
+    the archive boundary (or include_archived is set); a range that ends
+    before the boundary reads only the archive.
+    """
+    if since is None and until is None and not include_archived:
+        return Post
+    boundary = archive_boundary()
+    if boundary is None:
+        return Post
+    # An open start with a set end reaches back into the archive
+    needs_archive = include_archived or since is None or since <= boundary
+    needs_hot = until is None or until > boundary
+    if not needs_archive:
+        return Post
+    if not needs_hot:
+        return ArchivedPost
+
+    # Apply the range inside each branch so both tables can use their created_at indexes
+    branches = []
+    for table in (Post.__table__, ArchivedPost.__table__):
+        branch = select(*[table.c[column.name] for column in Post.__table__.c])
+        if since is not None:
+            branch = branch.where(table.c.created_at >= since)
+        if until is not None:
+            branch = branch.where(table.c.created_at < until)
+        branches.append(branch)
+    return aliased(Post, union_all(*branches).subquery('posts_all'))
@@ -0,0 +1,82 @@
+from extensions import db
+from models.post import Post
+from sqlalchemy import event, func, inspect, select
+from sqlalchemy.exc import IntegrityError
+
+
+class PostStat(db.Model):
+    """Materialized post counts per category and per author.
+
+    Kept in step with ``posts`` by the mapper events below, inside the same
+    transaction as the post insert/update/delete, so reads never aggregate
+    over the posts table.
+    """
+    __tablename__ = 'post_stats'
+    __table_args__ = (
+        db.UniqueConstraint('scope', 'scope_key', name='uq_post_stats_scope_key'),
+    )
+    id = db.Column(db.Integer, primary_key=True)
+    scope = db.Column(db.String(16), nullable=False)  # 'category' or 'user'
+    scope_key = db.Column(db.String(64), nullable=False)
+    post_count = db.Column(db.Integer, nullable=False, default=0)
+    latest_post_at = db.Column(db.DateTime)
+
+    def to_dict(self):
+        return {
+            'post_count': self.post_count,
+            'latest_post_at': self.latest_post_at.isoformat() if self.latest_post_at else None,
+        }
+
+
+# scope -> the posts column it aggregates over
+STAT_SCOPES = {
+    'category': Post.category,
+    'user': Post.user_id,
+}
+
+
+def _adjust(connection, scope, value, delta):
+    if value is None:
+        return
+    stats = PostStat.__table__
+    column = STAT_SCOPES[scope]
+    # Served by ix_posts_category_created_at / ix_posts_user_id_created_at
+    latest = select(func.max(Post.created_at)).where(column == value).scalar_subquery()
+    match = (stats.c.scope == scope) & (stats.c.scope_key == str(value))
+    update = stats.update().where(match).values(post_count=stats.c.post_count + delta, latest_post_at=latest)
+    if connection.execute(update).rowcount or delta < 0:
+        return
+    # First post for this key. A concurrent transaction may insert the same
+    # row first: keep the conflict inside a savepoint and add to its row instead.
+    try:
+        with connection.begin_nested():
+            connection.execute(
+                stats.insert().values(scope=scope, scope_key=str(value), post_count=delta, latest_post_at=latest)
+            )
+    except IntegrityError:
+        connection.execute(update)
+
+
+@event.listens_for(Post, 'after_insert')
+def _post_inserted(mapper, connection, target):
+    for scope, column in STAT_SCOPES.items():
+        _adjust(connection, scope, getattr(target, column.key), 1)
+
+
+@event.listens_for(Post, 'after_delete')
+def _post_deleted(mapper, connection, target):
+    for scope, column in STAT_SCOPES.items():
+        _adjust(connection, scope, getattr(target, column.key), -1)
+
+
+@event.listens_for(Post, 'after_update')
+def _post_updated(mapper, connection, target):
+    state = inspect(target)
+    for scope, column in STAT_SCOPES.items():
+        history = state.attrs[column.key].history
+        if not history.has_changes():
+            continue
+        for old in history.deleted or ():
+            _adjust(connection, scope, old, -1)
+        for new in history.added or ():
+            _adjust(connection, scope, new, 1)
@@ -21,7 +21,7 @@ class Profile(db.Model):
 class Skill(db.Model):
     __tablename__ = 'skills'
     id = db.Column(db.Integer, primary_key=True)
-    profile_id = db.Column(db.Integer, db.ForeignKey('profiles.id'), nullable=False)
+    profile_id = db.Column(db.Integer, db.ForeignKey('profiles.id'), nullable=False, index=True)
     name = db.Column(db.String(80), nullable=False)
 
 class Experience(db.Model):
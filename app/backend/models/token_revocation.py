@@ -0,0 +1,12 @@
+from extensions import db
+
+
+class TokenRevocation(db.Model):
+    """A revoked token (jti set, e.g. logout) or every token a user was issued
+    before revoked_at (jti NULL, e.g. password change)."""
+    __tablename__ = 'token_revocations'
+    id = db.Column(db.Integer, primary_key=True)
+    jti = db.Column(db.String(64), unique=True, nullable=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, index=True)
+    revoked_at = db.Column(db.BigInteger, nullable=False, index=True)  # epoch milliseconds, compared with the iat_ms claim
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
@@ -0,0 +1,9 @@
+"""Render snapshots for every public post and profile (initial backfill or after a schema change)."""
+from main import app
+from extensions import snapshots
+
+
+if __name__ == '__main__':
+    with app.app_context():
+        posts, profiles = snapshots.publish_all()
+    print(f'Published {posts} post and {profiles} profile snapshots to {snapshots.folder}.')
@@ -0,0 +1,145 @@
+import random
+import threading
+import time
+from functools import wraps
+
+from flask import current_app, g, has_request_context, request
+from flask_sqlalchemy.session import Session
+from itsdangerous import BadSignature, URLSafeSerializer
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import DBAPIError
+
+
+class RoutingSession(Session):
+    """Session that sends reads to the replica picked for the current request.
+
+    Anything that flushes (and every request without a picked replica) keeps
+    using the primary bind, so writes never reach a replica.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and not self._flushing and has_request_context():
+            replica = g.get('db_replica')
+            if replica is not None:
+                return replica
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+    def commit(self):
+        super().commit()
+        if has_request_context():
+            g.db_wrote = time.time()
+
+
+class ReplicaRouter:
+    """Picks a replica per request while keeping read-your-writes.
+
+    The time of a client's last committed write travels with the client, in
+    a signed cookie and the matching X-Last-Write response header (echoed
+    back as a request header by clients without cookies), so it holds
+    whichever worker serves the next request. A client that wrote within
+    SQLALCHEMY_READ_YOUR_WRITES seconds reads from the primary; lag checks
+    only decide which replicas everyone else may use, since a lag figure of
+    zero does not prove a particular write has arrived.
+    """
+    cookie_name = 'db_last_write'
+    header_name = 'X-Last-Write'
+
+    def __init__(self, app=None):
+        self.engines = []
+        self._health = {}  # engine -> (healthy, checked_at)
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.engines = [
+            create_engine(uri, pool_pre_ping=True)
+            for uri in app.config.get('SQLALCHEMY_REPLICA_URIS', [])
+        ]
+        self.max_lag = app.config.get('SQLALCHEMY_REPLICA_MAX_LAG', 5)
+        self.health_interval = app.config.get('SQLALCHEMY_REPLICA_HEALTH_INTERVAL', 10)
+        self.read_your_writes = app.config.get('SQLALCHEMY_READ_YOUR_WRITES', 30)
+        self._serializer = URLSafeSerializer(app.secret_key, salt='db-last-write')
+        app.extensions['replicas'] = self
+        app.after_request(self._remember_write)
+
+    def pick(self):
+        """Return a healthy replica engine for this request, or None for primary."""
+        if not self.engines or time.time() - self._last_write() < self.read_your_writes:
+            return None
+        healthy = [engine for engine in self.engines if self._is_healthy(engine)]
+        return random.choice(healthy) if healthy else None
+
+    def mark_down(self, engine):
+        with self._lock:
+            self._health[engine] = (False, time.monotonic())
+
+    def _is_healthy(self, engine):
+        now = time.monotonic()
+        healthy, checked_at = self._health.get(engine, (None, 0))
+        if healthy is not None and now - checked_at < self.health_interval:
+            return healthy
+        try:
+            with engine.connect() as conn:
+                healthy = _replication_lag(conn) <= self.max_lag
+        except DBAPIError:
+            healthy = False
+        with self._lock:
+            self._health[engine] = (healthy, now)
+        return healthy
+
+    def _last_write(self):
+        token = request.headers.get(self.header_name) or request.cookies.get(self.cookie_name)
+        if not token:
+            return 0
+        try:
+            return float(self._serializer.loads(token))
+        except (BadSignature, TypeError, ValueError):
+            return 0
+
+    def _remember_write(self, response):
+        wrote_at = g.pop('db_wrote', None)
+        if wrote_at is not None:
+            token = self._serializer.dumps(round(wrote_at, 3))
+            response.set_cookie(self.cookie_name, token, max_age=self.read_your_writes,
+                                httponly=True, samesite='Lax', secure=request.is_secure)
+            response.headers[self.header_name] = token
+        return response
+
+
+def _replication_lag(conn):
+    dialect = conn.dialect.name
+    if dialect == 'postgresql':
+        # An idle primary sends nothing to replay, so the replay timestamp alone
+        # would keep aging; a replica that has replayed all it received is current.
+        lag = conn.execute(text(
+            'SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 '
+            'ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END'
+        )).scalar()
+        return float(lag or 0)
+    if dialect == 'mysql':
+        status = conn.execute(text('SHOW SLAVE STATUS')).mappings().first()
+        if status is None:
+            return 0
+        lag = status.get('Seconds_Behind_Master')
+        return float('inf') if lag is None else float(lag)
+    conn.execute(text('SELECT 1'))
+    return 0
+
+
+def use_replica(view):
+    """Route the reads of a GET view to a replica, retrying on the primary if it fails."""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        router = current_app.extensions.get('replicas')
+        g.db_replica = router.pick() if router else None
+        if g.db_replica is None:
+            return view(*args, **kwargs)
+        try:
+            return view(*args, **kwargs)
+        except DBAPIError:
+            router.mark_down(g.db_replica)
+            current_app.extensions['sqlalchemy'].session.rollback()
+            g.db_replica = None
+            return view(*args, **kwargs)
+    return wrapper
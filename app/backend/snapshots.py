@@ -0,0 +1,233 @@
+"""Publish-time JSON snapshots of public posts and profiles.
+
+Whenever a commit touches a Post, Profile or Skill, the affected snapshots
+are re-rendered (from the primary, outside the committed session) into
+content-addressed files:
+
+    SNAPSHOT_FOLDER/<kind>/<id>/<version>.json   immutable, version = content hash
+    SNAPSHOT_FOLDER/<kind>/<id>/current          name of the live version
+
+The folder can be served straight from a CDN origin or nginx; the Flask
+routes in api/public.py serve the same files without touching the database
+and set Surrogate-Key headers so a change purges exactly one object.
+"""
+import hashlib
+import json
+import logging
+import os
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import current_app
+from sqlalchemy import event, select
+
+logger = logging.getLogger(__name__)
+
+KEEP_VERSIONS = 3  # older immutable versions kept for clients still holding their URL
+
+
+def surrogate_keys(kind, object_id):
+    return f'{kind}-{object_id} {kind}s'
+
+
+class Snapshots:
+    def __init__(self, app=None, session_class=None):
+        self._purger = ThreadPoolExecutor(max_workers=1, thread_name_prefix='snapshot-purge')
+        if app is not None:
+            self.init_app(app, session_class)
+
+    def init_app(self, app, session_class):
+        self.folder = app.config['SNAPSHOT_FOLDER']
+        self.purge_url = app.config.get('SNAPSHOT_PURGE_URL')
+        self.purge_token = app.config.get('SNAPSHOT_PURGE_TOKEN')
+        self.enabled = app.config.get('SNAPSHOTS_ENABLED', True)
+        app.extensions['snapshots'] = self
+        if not self.enabled:
+            return
+        os.makedirs(self.folder, exist_ok=True)
+        event.listen(session_class, 'after_flush', self._collect)
+        event.listen(session_class, 'after_commit', self._publish_collected)
+        event.listen(session_class, 'after_rollback', lambda session: session.info.pop('snapshot_keys', None))
+
+    # Change tracking
+
+    def _collect(self, session, flush_context):
+        from models.post import Post
+        from models.profile import Profile, Skill
+
+        keys = session.info.setdefault('snapshot_keys', set())
+        for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+            # Attributes may still hold what a view assigned (e.g. the JWT identity string)
+            if isinstance(obj, Post):
+                keys.add(('post', int(obj.id)))
+            elif isinstance(obj, Profile):
+                keys.add(('profile', int(obj.user_id)))
+            elif isinstance(obj, Skill) and obj.profile_id is not None:
+                keys.add(('profile_pk', int(obj.profile_id)))
+
+    def _publish_collected(self, session):
+        keys = session.info.pop('snapshot_keys', None)
+        if keys:
+            self.publish(keys)
+
+    # Rendering
+
+    def publish(self, keys):
+        """Re-render the given (kind, id) snapshots; kind is 'post' or 'profile'."""
+        if not self.enabled:
+            return
+        engine = current_app.extensions['sqlalchemy'].engine
+        with engine.connect() as conn:
+            for kind, object_id in keys:
+                try:
+                    if kind == 'profile_pk':
+                        kind, object_id = 'profile', self._profile_user_id(conn, object_id)
+                        if object_id is None:
+                            continue
+                    document = self._render_post(conn, object_id) if kind == 'post' \
+                        else self._render_profile(conn, object_id)
+                    if document is None:
+                        self._unpublish(kind, object_id)
+                    else:
+                        self._write(kind, object_id, document)
+                except Exception:
+                    # A failed snapshot must never fail the write that triggered it
+                    logger.exception('Failed to publish %s snapshot %s', kind, object_id)
+
+    def publish_all(self):
+        from models.post import Post
+        from models.profile import Profile
+        engine = current_app.extensions['sqlalchemy'].engine
+        with engine.connect() as conn:
+            posts = Post.__table__
+            post_ids = conn.execute(select(posts.c.id).where(posts.c.visibility == 'public')).scalars().all()
+            user_ids = conn.execute(select(Profile.__table__.c.user_id)).scalars().all()
+        self.publish([('post', i) for i in post_ids] + [('profile', i) for i in user_ids])
+        return len(post_ids), len(user_ids)
+
+    def _profile_user_id(self, conn, profile_id):
+        from models.profile import Profile
+        profiles = Profile.__table__
+        return conn.execute(select(profiles.c.user_id).where(profiles.c.id == profile_id)).scalar()
+
+    def _render_post(self, conn, post_id):
+        from models.post import Post
+        from models.post_archive import ArchivedPost
+        from models.user import User
+        users = User.__table__
+        for table in (Post.__table__, ArchivedPost.__table__):
+            row = conn.execute(
+                select(table, users.c.username).join(users, users.c.id == table.c.user_id)
+                .where(table.c.id == post_id)
+            ).mappings().first()
+            if row is not None:
+                break
+        if row is None or row['visibility'] != 'public':
+            return None
+        return {
+            'id': row['id'],
+            'user_id': row['user_id'],
+            'username': row['username'],
+            'content': row['content'],
+            'media_url': row['media_url'],
+            'created_at': row['created_at'].isoformat() if row['created_at'] else None,
+            'category': row['category'],
+            'tags': row['tags'].split(',') if row['tags'] else [],
+            'likes_count': row['likes_count'] or 0,
+            'views_count': row['views_count'] or 0,
+        }
+
+    def _render_profile(self, conn, user_id):
+        from models.profile import Profile, Skill
+        from models.user import User
+        profiles, skills, users = Profile.__table__, Skill.__table__, User.__table__
+        row = conn.execute(
+            select(profiles, users.c.username).join(users, users.c.id == profiles.c.user_id)
+            .where(profiles.c.user_id == user_id)
+        ).mappings().first()
+        if row is None:
+            return None
+        skill_names = conn.execute(
+            select(skills.c.name).where(skills.c.profile_id == row['id']).order_by(skills.c.id)
+        ).scalars().all()
+        # Public fields only: no email
+        return {
+            'id': row['user_id'],
+            'username': row['username'],
+            'profile': {
+                'full_name': row['full_name'] or '',
+                'headline': row['headline'] or '',
+                'summary': row['summary'] or '',
+                'location': row['location'] or '',
+                'avatarUrl': row['avatar_url'] or '',
+                'social': row['social'] or {},
+                'skills': list(skill_names),
+            },
+        }
+
+    # Storage
+
+    def _dir(self, kind, object_id):
+        return os.path.join(self.folder, kind + 's', str(int(object_id)))
+
+    def current_version(self, kind, object_id):
+        try:
+            with open(os.path.join(self._dir(kind, object_id), 'current')) as f:
+                return f.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def path(self, kind, object_id, version):
+        return os.path.join(self._dir(kind, object_id), f'{version}.json')
+
+    def _write(self, kind, object_id, document):
+        body = json.dumps(document, sort_keys=True, separators=(',', ':'), default=str).encode()
+        version = hashlib.sha256(body).hexdigest()[:16]
+        if version == self.current_version(kind, object_id):
+            return
+        directory = self._dir(kind, object_id)
+        os.makedirs(directory, exist_ok=True)
+        self._atomic_write(self.path(kind, object_id, version), body)
+        self._atomic_write(os.path.join(directory, 'current'), version.encode())
+        self._prune(directory)
+        self._purge(kind, object_id)
+
+    def _unpublish(self, kind, object_id):
+        directory = self._dir(kind, object_id)
+        if not os.path.isdir(directory):
+            return
+        for name in os.listdir(directory):
+            os.remove(os.path.join(directory, name))
+        os.rmdir(directory)
+        self._purge(kind, object_id)
+
+    @staticmethod
+    def _atomic_write(path, data):
+        tmp = f'{path}.tmp{os.getpid()}'
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    @staticmethod
+    def _prune(directory):
+        versions = sorted(
+            (entry for entry in os.scandir(directory) if entry.name.endswith('.json')),
+            key=lambda entry: entry.stat().st_mtime, reverse=True,
+        )
+        for entry in versions[KEEP_VERSIONS:]:
+            os.remove(entry.path)
+
+    def _purge(self, kind, object_id):
+        """Ask the CDN to drop everything tagged with this object's surrogate key."""
+        if not self.purge_url:
+            return
+        url = self.purge_url.format(key=f'{kind}-{object_id}')
+        headers = {'Fastly-Key': self.purge_token} if self.purge_token else {}
+
+        def send():
+            try:
+                urllib.request.urlopen(urllib.request.Request(url, method='POST', headers=headers), timeout=5)
+            except Exception:
+                logger.exception('Snapshot purge failed for %s', url)
+
+        self._purger.submit(send)
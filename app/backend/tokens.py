@@ -0,0 +1,217 @@
+import hashlib
+import math
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+from flask import current_app, jsonify
+from flask_jwt_extended import JWTManager
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+
+from metrics import record_cache
+
+
+def _now_ms():
+    return int(time.time() * 1000)
+
+
+def _seconds(delta, default):
+    return delta.total_seconds() if isinstance(delta, timedelta) else default
+
+
+class CachedJWTManager(JWTManager):
+    """JWTManager that remembers tokens whose signature it already checked.
+
+    Entries are keyed by the SHA-256 of the encoded token and live until the
+    token's own ``exp`` (at most JWT_ACCESS_TOKEN_EXPIRES), so a repeat request
+    costs one hash and one dict lookup instead of a signature verification.
+    Revocation is still checked on every request by the blocklist loader.
+    """
+
+    def __init__(self, app=None, **kwargs):
+        self._verified = OrderedDict()  # token hash -> (expires_at, decoded payload)
+        self._verified_lock = threading.Lock()
+        self.cache_size = 10000
+        self.cache_ttl = 3600
+        super().__init__(app, **kwargs)
+
+    def init_app(self, app, **kwargs):
+        super().init_app(app, **kwargs)
+        self.cache_size = app.config.get('JWT_VERIFY_CACHE_SIZE', 10000)
+        self.cache_ttl = _seconds(app.config.get('JWT_ACCESS_TOKEN_EXPIRES'), 3600)
+
+    def _decode_jwt_from_config(self, encoded_token, csrf_value=None, allow_expired=False):
+        if csrf_value is not None or allow_expired:
+            return super()._decode_jwt_from_config(encoded_token, csrf_value, allow_expired)
+        key = hashlib.sha256(encoded_token.encode()).digest()
+        now = time.time()
+        with self._verified_lock:
+            entry = self._verified.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._verified.move_to_end(key)
+                    record_cache('jwt_verified', True)
+                    return entry[1]
+                del self._verified[key]
+        record_cache('jwt_verified', False)
+        decoded = super()._decode_jwt_from_config(encoded_token, csrf_value, allow_expired)
+        expires_at = min(decoded.get('exp', now + self.cache_ttl), now + self.cache_ttl)
+        with self._verified_lock:
+            self._verified[key] = (expires_at, decoded)
+            while len(self._verified) > self.cache_size:
+                self._verified.popitem(last=False)
+        return decoded
+
+
+class BloomFilter:
+    def __init__(self, capacity, error_rate=0.01):
+        self.capacity = capacity
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item):
+        # Double hashing: k positions from the two halves of one SHA-256 digest
+        digest = hashlib.sha256(item.encode()).digest()
+        h1 = int.from_bytes(digest[:8], 'big')
+        h2 = int.from_bytes(digest[8:16], 'big') | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, item):
+        if item in self:
+            return  # re-synced rows must not eat into the capacity
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, item):
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+class RevocationList:
+    """In-memory view of token_revocations, refreshed from the database.
+
+    Revoked jtis go into a Bloom filter: a miss (the common case) is answered
+    without touching the database, a hit is confirmed with a primary-key-like
+    lookup. User-wide revocations (password change) are kept as a small
+    user_id -> revoked_at map and compared with the token's ``iat_ms`` claim.
+    Other workers pick up new rows within JWT_REVOCATION_SYNC_SECONDS.
+
+    Incremental syncs read rows by revoked_at, reaching back
+    JWT_REVOCATION_SYNC_OVERLAP_SECONDS past the newest one seen: ids and
+    revoked_at are both assigned before commit, so rows can become visible
+    out of order. A full reload every JWT_REVOCATION_RELOAD_SECONDS bounds
+    anything the overlap still misses (e.g. clock skew between hosts).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._bloom = None
+        self._user_cutoffs = {}
+        self._watermark = 0  # newest revoked_at seen, epoch ms
+        self._synced_at = 0
+        self._reloaded_at = 0
+
+    def init_app(self, app, jwt):
+        self.capacity = app.config.get('JWT_REVOCATION_CAPACITY', 100000)
+        self.sync_interval = app.config.get('JWT_REVOCATION_SYNC_SECONDS', 5)
+        self.sync_overlap_ms = app.config.get('JWT_REVOCATION_SYNC_OVERLAP_SECONDS', 60) * 1000
+        self.reload_interval = app.config.get('JWT_REVOCATION_RELOAD_SECONDS', 300)
+        self.refresh_ttl = timedelta(seconds=_seconds(app.config.get('JWT_REFRESH_TOKEN_EXPIRES'), 30 * 86400))
+        app.extensions['revocations'] = self
+        jwt.token_in_blocklist_loader(self.is_revoked)
+        jwt.additional_claims_loader(lambda identity: {'iat_ms': _now_ms()})
+
+    @property
+    def _table(self):
+        from models.token_revocation import TokenRevocation
+        return TokenRevocation.__table__
+
+    def _engine(self):
+        # Always the primary: a lagging replica would let revoked tokens through
+        return current_app.extensions['sqlalchemy'].engine
+
+    def _sync(self):
+        now = time.monotonic()
+        if self._bloom is not None and now - self._synced_at < self.sync_interval:
+            return
+        with self._lock:
+            if self._bloom is not None and now - self._synced_at < self.sync_interval:
+                return
+            table = self._table
+            reload = self._bloom is None or self._bloom.count >= self._bloom.capacity \
+                or now - self._reloaded_at >= self.reload_interval
+            query = select(table.c.jti, table.c.user_id, table.c.revoked_at)
+            if reload:
+                query = query.where(table.c.expires_at > datetime.utcnow())
+            else:
+                # Served by ix_token_revocations_revoked_at
+                query = query.where(table.c.revoked_at > self._watermark - self.sync_overlap_ms)
+            with self._engine().connect() as conn:
+                rows = conn.execute(query).all()
+            if reload:
+                self._bloom = BloomFilter(max(self.capacity, len(rows) * 2))
+                self._user_cutoffs = {}
+                self._reloaded_at = now
+            for row in rows:
+                self._apply(row.jti, row.user_id, row.revoked_at)
+                self._watermark = max(self._watermark, row.revoked_at)
+            self._synced_at = now
+
+    def _apply(self, jti, user_id, revoked_at):
+        if jti:
+            self._bloom.add(jti)
+        else:
+            key = str(user_id)
+            self._user_cutoffs[key] = max(self._user_cutoffs.get(key, 0), revoked_at)
+
+    def is_revoked(self, jwt_header, jwt_payload):
+        self._sync()
+        cutoff = self._user_cutoffs.get(str(jwt_payload['sub']))
+        if cutoff and jwt_payload.get('iat_ms', jwt_payload['iat'] * 1000) < cutoff:
+            return True
+        jti = jwt_payload.get('jti')
+        if not jti or jti not in self._bloom:
+            return False
+        table = self._table
+        with self._engine().connect() as conn:
+            return conn.execute(select(table.c.id).where(table.c.jti == jti)).first() is not None
+
+    def _record(self, jti, user_id, expires_at):
+        from models.token_revocation import TokenRevocation
+        db = current_app.extensions['sqlalchemy']
+        revoked_at = _now_ms()
+        db.session.add(TokenRevocation(jti=jti, user_id=user_id, revoked_at=revoked_at, expires_at=expires_at))
+        try:
+            db.session.commit()
+        except IntegrityError:
+            # jti already revoked (repeated or concurrent logout): nothing left to do
+            db.session.rollback()
+            return
+        self._sync()
+        with self._lock:
+            self._apply(jti, user_id, revoked_at)
+
+    def revoke_token(self, jwt_payload):
+        """Revoke a single token (logout)."""
+        self._record(jwt_payload['jti'], int(jwt_payload['sub']), datetime.utcfromtimestamp(jwt_payload['exp']))
+
+    def revoke_user(self, user_id):
+        """Revoke every token issued to the user so far (password change)."""
+        self._record(None, int(user_id), datetime.utcnow() + self.refresh_ttl)
+
+
+def log_jwt_errors(jwt):
+    """Log rejected tokens while keeping flask_jwt_extended's default responses."""
+    @jwt.unauthorized_loader
+    def unauthorized(reason):
+        print(f"[JWT ERROR] {reason}")
+        return jsonify({current_app.config.get('JWT_ERROR_MESSAGE_KEY', 'msg'): reason}), 401
+
+    @jwt.invalid_token_loader
+    def invalid_token(reason):
+        print(f"[JWT ERROR] {reason}")
+        return jsonify({current_app.config.get('JWT_ERROR_MESSAGE_KEY', 'msg'): reason}), 422
@@ -2,6 +2,7 @@ import React, { useState } from 'react';
 import { Link, useNavigate } from 'react-router-dom';
 import { useAuth } from '../../context/AuthContext';
 import { authApi } from './api';
+import { prefetchInitialData } from '../../services/api';
 
 const Login: React.FC = () => {
   const [identifier, setIdentifier] = useState('');
@@ -23,6 +24,7 @@ const Login: React.FC = () => {
       if (res.user) {
         login(res.user);
         if (res.token) localStorage.setItem('token', res.token);
+        prefetchInitialData();
         console.log('Saving user to localStorage:', res.user);
         navigate('/'); // Redirect to home page after login
       } else {
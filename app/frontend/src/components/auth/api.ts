@@ -1,8 +1,10 @@
+import { apiFetch } from '../../services/api';
+
 const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:5000';
 
 export const authApi = {
   login: async (credentials: { email: string; username: string; password: string }) => {
-    const response = await fetch(`${API_URL}/api/auth/login`, {
+    const response = await apiFetch(`${API_URL}/api/auth/login`, {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
       body: JSON.stringify(credentials),
@@ -11,7 +13,7 @@ export const authApi = {
   },
 
   signup: async (userData: { username: string; email: string; password: string }) => {
-    const response = await fetch(`${API_URL}/api/auth/signup`, {
+    const response = await apiFetch(`${API_URL}/api/auth/signup`, {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
       body: JSON.stringify(userData),
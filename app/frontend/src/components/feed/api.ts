@@ -1,8 +1,14 @@
+import { apiFetch, takeInitialData } from '../../services/api';
+
 const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:5000';
 
 export const feedApi = {
   getFeed: async () => {
-    const response = await fetch(`${API_URL}/feed`, {
+    const initial = await takeInitialData('feed');
+    if (initial && initial.status === 200) {
+      return initial.body;
+    }
+    const response = await apiFetch(`${API_URL}/feed`, {
       headers: {
         'Authorization': `Bearer ${localStorage.getItem('token')}`,
       },
@@ -11,7 +17,7 @@ export const feedApi = {
   },
 
   getFeedByUser: async (userId: number) => {
-    const response = await fetch(`${API_URL}/feed/user/${userId}`, {
+    const response = await apiFetch(`${API_URL}/feed/user/${userId}`, {
       headers: {
         'Authorization': `Bearer ${localStorage.getItem('token')}`,
       },
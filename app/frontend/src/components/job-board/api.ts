@@ -1,8 +1,10 @@
+import { apiFetch } from '../../services/api';
+
 const API_URL = 'http://localhost:5000';
 
 export const jobsApi = {
   getJobs: async () => {
-    const response = await fetch(`${API_URL}/jobs`, {
+    const response = await apiFetch(`${API_URL}/jobs`, {
       headers: {
         'Authorization': `Bearer ${localStorage.getItem('token')}`,
       },
@@ -11,7 +13,7 @@ export const jobsApi = {
   },
 
   getJob: async (jobId: number) => {
-    const response = await fetch(`${API_URL}/jobs/${jobId}`, {
+    const response = await apiFetch(`${API_URL}/jobs/${jobId}`, {
       headers: {
         'Authorization': `Bearer ${localStorage.getItem('token')}`,
       },
@@ -20,7 +22,7 @@ export const jobsApi = {
   },
 
   applyForJob: async (jobId: number) => {
-    const response = await fetch(`${API_URL}/jobs/${jobId}/apply`, {
+    const response = await apiFetch(`${API_URL}/jobs/${jobId}/apply`, {
       method: 'POST',
       headers: {
         'Authorization': `Bearer ${localStorage.getItem('token')}`,
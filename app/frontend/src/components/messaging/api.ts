@@ -1,8 +1,10 @@
+import { apiFetch } from '../../services/api';
+
 const API_URL = 'http://localhost:5000';
 
 export const messagingApi = {
   getConversations: async () => {
-    const response = await fetch(`${API_URL}/messages/conversations`, {
+    const response = await apiFetch(`${API_URL}/messages/conversations`, {
       headers: {
         'Authorization': `Bearer ${localStorage.getItem('token')}`,
       },
@@ -11,7 +13,7 @@ export const messagingApi = {
   },
 
   getMessages: async (conversationId: number) => {
-    const response = await fetch(`${API_URL}/messages/${conversationId}`, {
+    const response = await apiFetch(`${API_URL}/messages/${conversationId}`, {
       headers: {
         'Authorization': `Bearer ${localStorage.getItem('token')}`,
       },
@@ -20,7 +22,7 @@ export const messagingApi = {
   },
 
   sendMessage: async (conversationId: number, content: string) => {
-    const response = await fetch(`${API_URL}/messages/${conversationId}`, {
+    const response = await apiFetch(`${API_URL}/messages/${conversationId}`, {
       method: 'POST',
       headers: {
         'Content-Type': 'application/json',
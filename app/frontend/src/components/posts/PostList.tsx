@@ -1,4 +1,5 @@
 import React, { useEffect, useState, useRef, useCallback, useMemo } from 'react';
+import { apiFetch, takeInitialData } from '../../services/api';
 
 const API_URL = 'http://localhost:5000/api/posts';
 
@@ -170,18 +171,25 @@ const PostList: React.FC = () => {
   const [popularTags, setPopularTags] = useState<string[]>([]);
   const debouncedSearch = useDebounce(search, 500);
 
-  // Fetch categories and tags from backend
+  // Fetch categories and tags from backend (from the initial batch when it has them)
   useEffect(() => {
-    fetch(`${API_URL}/categories`)
-      .then(res => res.json())
+    const load = async (key: 'categories' | 'tags', path: string) => {
+      const initial = await takeInitialData(key);
+      if (initial && initial.status === 200) return initial.body;
+      const res = await apiFetch(`${API_URL}/${path}`);
+      return res.json();
+    };
+    load('categories', 'categories')
       .then(data => setCategories(['All', ...(data.categories || [])]))
       .catch(() => setCategories(['All']));
-    fetch(`${API_URL}/popular-tags`)
-      .then(res => res.json())
+    load('tags', 'popular-tags')
       .then(data => setPopularTags(data.tags || []))
       .catch(() => setPopularTags([]));
   }, []);
 
+  // The first page with default filters comes with the initial batch
+  const firstLoad = useRef(true);
+
   const fetchPosts = useCallback(async (pageNum: number, reset = false) => {
     setLoading(true);
     setError(null);
@@ -195,8 +203,17 @@ const PostList: React.FC = () => {
       if (visibility) params.append('visibility', visibility);
       if (sort) params.append('sort', sort);
       if (order) params.append('order', order);
-      const res = await fetch(`${API_URL}?${params.toString()}`);
-      const data = await res.json();
+      const isDefault = pageNum === 1 && category === 'All' && !debouncedSearch && !tags && !visibility
+        && sort === 'created_at' && order === 'desc';
+      const initial = firstLoad.current && isDefault ? await takeInitialData('posts') : undefined;
+      firstLoad.current = false;
+      let data;
+      if (initial && initial.status === 200) {
+        data = initial.body;
+      } else {
+        const res = await apiFetch(`${API_URL}?${params.toString()}`);
+        data = await res.json();
+      }
       if (reset) {
         setPosts(data.posts);
       } else if (pageNum === 1) {
@@ -1,3 +1,5 @@
+import { apiFetch } from '../../services/api';
+
 const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:5000';
 
 export const postsApi = {
@@ -8,7 +10,7 @@ export const postsApi = {
     if (media) {
       formData.append('media', media);
     }
-    const response = await fetch(`${API_URL}/api/posts`, {
+    const response = await apiFetch(`${API_URL}/api/posts`, {
       method: 'POST',
       headers: {
         'Authorization': `Bearer ${localStorage.getItem('token') || ''}`,
@@ -19,7 +21,7 @@ export const postsApi = {
   },
 
   getPosts: async () => {
-    const response = await fetch(`${API_URL}/posts`, {
+    const response = await apiFetch(`${API_URL}/posts`, {
       headers: {
         'Authorization': `Bearer ${localStorage.getItem('token')}`,
       },
@@ -28,7 +30,7 @@ export const postsApi = {
   },
 
   likePost: async (postId: number) => {
-    const response = await fetch(`${API_URL}/posts/${postId}/like`, {
+    const response = await apiFetch(`${API_URL}/posts/${postId}/like`, {
       method: 'POST',
       headers: {
         'Authorization': `Bearer ${localStorage.getItem('token')}`,
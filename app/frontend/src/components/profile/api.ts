@@ -1,8 +1,14 @@
+import { apiFetch, takeInitialData } from '../../services/api';
+
 const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:5000';
 
 export const profileApi = {
   getProfile: async () => {
-    const response = await fetch(`${API_URL}/profile`, {
+    const initial = await takeInitialData('profile');
+    if (initial && initial.status === 200) {
+      return initial.body;
+    }
+    const response = await apiFetch(`${API_URL}/profile`, {
       headers: {
         'Authorization': `Bearer ${localStorage.getItem('token')}`,
       },
@@ -17,7 +23,7 @@ export const profileApi = {
   },
 
   updateProfile: async (profileData: any) => {
-    const response = await fetch(`${API_URL}/profile`, {
+    const response = await apiFetch(`${API_URL}/profile`, {
       method: 'PUT',
       headers: {
         'Content-Type': 'application/json',
@@ -37,7 +43,7 @@ export const profileApi = {
   uploadProfileImage: async (image: File) => {
     const formData = new FormData();
     formData.append('image', image);
-    const response = await fetch(`${API_URL}/profile/image`, {
+    const response = await apiFetch(`${API_URL}/profile/image`, {
       method: 'POST',
       headers: {
         'Authorization': `Bearer ${localStorage.getItem('token')}`,
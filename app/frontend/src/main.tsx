@@ -2,6 +2,10 @@ import { StrictMode } from 'react'
 import { createRoot } from 'react-dom/client'
 import './index.css'
 import App from './App.tsx'
+import { prefetchInitialData } from './services/api'
+
+// Start the first screen's data in one batch while React mounts
+prefetchInitialData()
 
 createRoot(document.getElementById('root')!).render(
   <StrictMode>
@@ -1,9 +1,29 @@
 const API_URL = 'http://localhost:5000';
 
+// The backend answers every write with a signed X-Last-Write token (see
+// replicas.py); sending it back keeps this client's reads on the primary for a
+// while. Cookies don't cross from the dev server's origin, so it goes in a header.
+const LAST_WRITE_KEY = 'lastWrite';
+
+export const apiFetch = async (input: string, init: RequestInit = {}) => {
+  const headers = new Headers(init.headers);
+  const lastWrite = localStorage.getItem(LAST_WRITE_KEY);
+  if (lastWrite) headers.set('X-Last-Write', lastWrite);
+  const method = (init.method || 'GET').toUpperCase();
+  if (method !== 'GET' && !input.endsWith('/api/batch')) {
+    // Anything prefetched before a write may no longer be current
+    discardInitialData();
+  }
+  const response = await fetch(input, { ...init, headers });
+  const token = response.headers.get('X-Last-Write');
+  if (token) localStorage.setItem(LAST_WRITE_KEY, token);
+  return response;
+};
+
 export const api = {
   // Auth endpoints
   login: async (credentials: { email: string; password: string }) => {
-    const response = await fetch(`${API_URL}/auth/login`, {
+    const response = await apiFetch(`${API_URL}/auth/login`, {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
       body: JSON.stringify(credentials),
@@ -12,7 +32,7 @@ export const api = {
   },
 
   signup: async (userData: { email: string; password: string; name: string }) => {
-    const response = await fetch(`${API_URL}/auth/signup`, {
+    const response = await apiFetch(`${API_URL}/auth/signup`, {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
       body: JSON.stringify(userData),
@@ -22,7 +42,7 @@ export const api = {
 
   // Profile endpoints
   getProfile: async () => {
-    const response = await fetch(`${API_URL}/profile`, {
+    const response = await apiFetch(`${API_URL}/profile`, {
       headers: {
         'Authorization': `Bearer ${localStorage.getItem('token')}`,
       },
@@ -31,7 +51,7 @@ export const api = {
   },
 
   updateProfile: async (profileData: any) => {
-    const response = await fetch(`${API_URL}/profile`, {
+    const response = await apiFetch(`${API_URL}/profile`, {
       method: 'PUT',
       headers: {
         'Content-Type': 'application/json',
@@ -41,4 +61,63 @@ export const api = {
     });
     return response.json();
   },
-}; 
\ No newline at end of file
+
+  // Batch endpoint: several GETs in one round trip
+  batch: async (requests: string[], parallel = false) => {
+    const response = await apiFetch(`${API_URL}/api/batch`, {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+        'Authorization': `Bearer ${localStorage.getItem('token')}`,
+      },
+      body: JSON.stringify({ requests, parallel }),
+    });
+    return response.json();
+  },
+
+  getInitialData: async () => {
+    const { responses } = await api.batch([
+      'GET /feed',
+      'GET /profile',
+      'GET /api/posts?page=1&per_page=10',
+      'GET /api/posts/categories',
+      'GET /api/posts/popular-tags',
+    ]);
+    const [feed, profile, posts, categories, tags] = responses as InitialResponse[];
+    return { feed, profile, posts, categories, tags };
+  },
+};
+
+type InitialResponse = { status: number; body: any };
+type InitialData = Partial<Record<'feed' | 'profile' | 'posts' | 'categories' | 'tags', InitialResponse>>;
+
+// The first screen's GETs share one batch round trip, started at app load
+// (prefetchInitialData). Each piece is handed out once and only while fresh;
+// everything else (later visits, after any write) uses the regular endpoints.
+const INITIAL_DATA_TTL_MS = 15000;
+let initialData: Promise<InitialData> | null = null;
+let initialDataAt = 0;
+
+export const prefetchInitialData = () => {
+  if (!localStorage.getItem('token')) return;
+  initialDataAt = Date.now();
+  initialData = api.getInitialData().catch(() => ({}));
+};
+
+export const discardInitialData = () => {
+  initialData = null;
+};
+
+export const takeInitialData = async (key: keyof InitialData) => {
+  if (!initialData) return undefined;
+  const pending = initialData;
+  const data = await pending;
+  if (pending !== initialData || Date.now() - initialDataAt > INITIAL_DATA_TTL_MS) {
+    // Discarded by a write while we waited, or too old to show
+    discardInitialData();
+    return undefined;
+  }
+  const piece = data[key];
+  delete data[key];
+  return piece;
+};